@@ -46,7 +46,9 @@ def main(parsed_args):
       if function_choice == '1':
         parse_input.GetFieldsForTypeName(ontology)
       elif function_choice == '2':
-        parse_input.GetTypesForFieldList(ontology)
+        parse_input.GetTypesForFieldList(
+            ontology, parsed_args.fields_filepath
+        )
       elif function_choice == '3':
         parse_input.ValidateFieldName(ontology)
       elif function_choice == '4':
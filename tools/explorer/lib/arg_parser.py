@@ -33,4 +33,12 @@ def ParseArgs() -> argparse.ArgumentParser:
       help='Filepath to modified ontology filepaths',
       metavar='FILE')
 
+  parser.add_argument(
+      '-f',
+      '--fields-file',
+      dest='fields_filepath',
+      required=False,
+      help='Filepath to a list of fields to match against entity types',
+      metavar='FILE')
+
   return parser
@@ -38,6 +38,8 @@ class StandardField(object):
     returns: An instance of the StandardField class.
   """
 
+  __slots__ = ('_namespace', '_name', '_increment')
+
   def __init__(self,
                namespace_name: str,
                standard_field_name: str,
@@ -97,6 +99,8 @@ class EntityTypeField(StandardField):
       An instance of the EntityTypeField class.
   """
 
+  __slots__ = ('_is_optional',)
+
   def __init__(self,
                namespace_name: str,
                standard_field_name: str,
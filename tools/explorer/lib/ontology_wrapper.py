@@ -13,8 +13,12 @@
 # limitations under the License.
 
 """Ontology wrapper class for DBO explorer."""
+import heapq
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
-from typing import Set
+from typing import Tuple
 
 import colorama
 from termcolor import colored
@@ -23,12 +27,21 @@ from lib.model import EntityTypeField
 from lib.model import Match
 from lib.model import StandardField
 from lib.model import StandardizeField
+from yamlformat.validator import entity_type_lib
 from yamlformat.validator.entity_type_lib import EntityType
 from yamlformat.validator.entity_type_manager import EntityTypeManager
+from yamlformat.validator.field_lib import SplitFieldName
 from yamlformat.validator.presubmit_validate_types_lib import ConfigUniverse
 
 colorama.init()
 
+if hasattr(int, 'bit_count'):
+  _PopCount = int.bit_count  # pylint: disable=invalid-name
+else:
+  # int.bit_count() is only available from Python 3.10 onwards.
+  def _PopCount(mask: int) -> int:
+    return bin(mask).count('1')
+
 
 class OntologyWrapper(object):
   """Class providing an interface to do lookups on DBO.
@@ -40,6 +53,29 @@ class OntologyWrapper(object):
         of fields between entity types and complete lists of inherited
         fields for a concrete entity. This is primarily used for
         _CreateMatch().
+      _field_ids: A dictionary assigning each standardized field implemented
+        by an entity type a bit position in the field bitmasks.
+      _canonical_cache: A dictionary mapping the id of each entity type to a
+        tuple of bitmasks of its standardized fields and its standardized
+        required fields, along with its number of required fields. This is
+        primarily used for _CreateMatch().
+      _field_to_types: A dictionary mapping each standardized field to the list
+        of entity types in _concrete_types implementing it. This is primarily
+        used for GetEntityTypesFromFields().
+      _concrete_types: A list of the entity types eligible for matching, i.e.
+        those which are not abstract and implement at least one field.
+      _type_order: A dictionary mapping the id of each entity type in
+        _concrete_types to its position in that list.
+      _concrete_types_by_general: A dictionary mapping each parent type name
+        to the list of entity types in _concrete_types inheriting from it.
+      _standard_fields: A dictionary interning one StandardField per
+        (namespace, field name, increment) key, shared by every entity type
+        implementing that field. Only used while building the caches above.
+      _valid_field_keys: A frozenset of (namespace, field name) tuples for
+        every field defined in the field universe.
+      _type_fields_cache: A dictionary mapping the id of an entity type to a
+        tuple of its sorted EntityTypeField objects and its sorted required
+        EntityTypeField objects. Filled on demand by _SortedTypeFields().
     Returns:
       An instance of OntologyWrapper class.
   """
@@ -54,6 +90,107 @@ class OntologyWrapper(object):
     super().__init__()
     self.universe = universe
     self.manager = EntityTypeManager(self.universe)
+    self._field_ids: Dict[StandardField, int] = {}
+    self._canonical_cache: Dict[int, Tuple[int, int, int]] = {}
+    self._field_to_types: Dict[StandardField, List[EntityType]] = {}
+    self._concrete_types: List[EntityType] = []
+    self._type_order: Dict[int, int] = {}
+    self._concrete_types_by_general: Dict[str, List[EntityType]] = {}
+    self._standard_fields: Dict[Tuple[str, str, str], StandardField] = {}
+    self._valid_field_keys: FrozenSet[Tuple[str, str]] = frozenset(
+        SplitFieldName(qualified_field_name) for qualified_field_name in
+        self.universe.field_universe.GetFieldsMap())
+    self._type_fields_cache: Dict[int, Tuple[Tuple[EntityTypeField, ...],
+                                             Tuple[EntityTypeField, ...]]] = {}
+    for tns in self.universe.GetEntityTypeNamespaces():
+      for entity_type in tns.valid_types_map.values():
+        canonical_fields = self._StandardizeTypeFields(entity_type)
+        self._canonical_cache[id(entity_type)] = self._CanonicalFieldMasks(
+            canonical_fields)
+        if entity_type.is_abstract or not canonical_fields[0]:
+          continue
+        self._type_order[id(entity_type)] = len(self._concrete_types)
+        self._concrete_types.append(entity_type)
+        for standard_field in canonical_fields[0]:
+          self._field_to_types.setdefault(standard_field, []).append(
+              entity_type)
+        for parent_name in dict.fromkeys(
+            entity_type.unqualified_parent_names or ()):
+          self._concrete_types_by_general.setdefault(parent_name, []).append(
+              entity_type)
+
+  def _StandardizeTypeFields(
+      self, entity_type: EntityType
+  ) -> Tuple[FrozenSet[StandardField], FrozenSet[StandardField]]:
+    """Converts the fields of an entity type into StandardField frozensets.
+
+    Args:
+      entity_type: An EntityType object.
+
+    Returns:
+      A tuple of a frozenset of all standardized fields for entity_type and a
+      frozenset of its standardized required fields.
+    """
+    field_optionality = {}
+    for qualified_field in entity_type.GetAllFields().values():
+      # Fields are shared between many entity types, so each distinct field is
+      # standardized once per wrapper rather than once per type.
+      field_key = (qualified_field.field.namespace,
+                   qualified_field.field.field,
+                   qualified_field.field.increment)
+      standard_field = self._standard_fields.get(field_key)
+      if standard_field is None:
+        standard_field = StandardField(*field_key)
+        self._standard_fields[field_key] = standard_field
+      field_optionality[standard_field] = qualified_field.optional
+    return (frozenset(field_optionality),
+            frozenset(field for field, optional in field_optionality.items()
+                      if not optional))
+
+  def _FieldMask(self,
+                 fields: Iterable[StandardField],
+                 register: bool = False) -> int:
+    """Encodes a collection of fields as a bitmask over _field_ids.
+
+    Args:
+      fields: StandardField objects to encode.
+      register: when true, fields without a bit position are assigned one.
+        Otherwise they are left out of the mask, as they cannot match any
+        entity type.
+
+    Returns:
+      An int with the bit of every encoded field set.
+    """
+    mask = 0
+    for field in fields:
+      field_id = self._field_ids.get(field)
+      if field_id is None:
+        if not register:
+          continue
+        field_id = len(self._field_ids)
+        self._field_ids[field] = field_id
+      mask |= 1 << field_id
+    return mask
+
+  def _CanonicalFieldMasks(
+      self,
+      canonical_fields: Tuple[FrozenSet[StandardField],
+                              FrozenSet[StandardField]]
+  ) -> Tuple[int, int, int]:
+    """Encodes the standardized fields of an entity type as bitmasks.
+
+    Args:
+      canonical_fields: the output of _StandardizeTypeFields() for an entity
+        type.
+
+    Returns:
+      A tuple of the bitmask of all fields for the entity type, the bitmask of
+      its required fields and the number of required fields.
+    """
+    standard_canonical_fields, required_canonical_fields = canonical_fields
+    return (self._FieldMask(standard_canonical_fields, register=True),
+            self._FieldMask(required_canonical_fields, register=True),
+            len(required_canonical_fields))
 
   def GetFieldsForTypeName(
       self,
@@ -84,28 +221,52 @@ class OntologyWrapper(object):
       raise ValueError(
           'Inherited fields must be expanded to query fields.\n' +
           'Run NamespaceValidator on your ConfigUniverse to expand fields.')
-    # Entity_type_lib.FieldParts NamedTuple to EntityTypeField object.
-    entity_type_fields = []
-    for qualified_field in entity_type.GetAllFields().values():
-      new_entity_type_field = EntityTypeField(qualified_field.field.namespace,
-                                              qualified_field.field.field,
-                                              qualified_field.optional,
-                                              qualified_field.field.increment)
-      entity_type_fields.append(new_entity_type_field)
+    entity_type_fields, required_entity_type_fields = self._SortedTypeFields(
+        entity_type)
 
     if required_only:
-      entity_type_fields = [
-          field for field in entity_type_fields if not field.IsOptional()
-      ]
-    entity_type_fields_sorted = sorted(
-        entity_type_fields,
-        key=lambda x: x.GetStandardFieldName(),
-        reverse=False)
-
-    return entity_type_fields_sorted
-
-  def _CalculateMatchScore(self, concrete_fields: Set[StandardField],
-                           canonical_fields: Set[EntityTypeField])-> int:
+      return list(required_entity_type_fields)
+    return list(entity_type_fields)
+
+  def _SortedTypeFields(
+      self, entity_type: EntityType
+  ) -> Tuple[Tuple[EntityTypeField, ...], Tuple[EntityTypeField, ...]]:
+    """Converts the fields of an entity type into sorted EntityTypeFields.
+
+    Results are kept in _type_fields_cache so each entity type's fields are
+    only walked once.
+
+    Args:
+      entity_type: An EntityType object with inherited fields expanded.
+
+    Returns:
+      A tuple of all EntityTypeField objects for entity_type and of its required
+      EntityTypeField objects, each sorted by field name.
+    """
+    type_fields = self._type_fields_cache.get(id(entity_type))
+    if type_fields is not None:
+      return type_fields
+
+    # Entity_type_lib.FieldParts NamedTuple to EntityTypeField object.
+    entity_type_fields_sorted = tuple(sorted(
+        (EntityTypeField(qualified_field.field.namespace,
+                         qualified_field.field.field,
+                         qualified_field.optional,
+                         qualified_field.field.increment)
+         for qualified_field in entity_type.GetAllFields().values()),
+        key=EntityTypeField.GetStandardFieldName))
+    required_fields_sorted = tuple(
+        field for field in entity_type_fields_sorted if not field.IsOptional()
+    )
+
+    type_fields = (entity_type_fields_sorted, required_fields_sorted)
+    self._type_fields_cache[id(entity_type)] = type_fields
+    return type_fields
+
+  def _CalculateMatchScore(self, concrete_mask: int, total_entity_fields: int,
+                           standard_canonical_mask: int,
+                           required_canonical_mask: int,
+                           total_required_type_fields: int) -> int:
     """Calculates a match's score in [0, 100].
 
     The score of a match is determined by calculating the average of two
@@ -116,39 +277,32 @@ class OntologyWrapper(object):
     canonical fields, and dividing by 2 keeps the range of the function in
     [0, 100].
 
+    Field sets are given as bitmasks built by _FieldMask(), so set
+    intersections reduce to a bitwise and followed by a popcount.
+
     Args:
-      concrete_fields: A set of StandardField objects belonging to the
+      concrete_mask: A bitmask of the StandardField objects belonging to the
         concrete entity being matched.
-      canonical_fields: A set of EntityTypeField objects belonging to an Entity
+      total_entity_fields: The number of distinct fields of the concrete
+        entity, including fields absent from concrete_mask.
+      standard_canonical_mask: A bitmask of all fields of an Entity Type
+        defined in DBO.
+      required_canonical_mask: A bitmask of the required fields of an Entity
         Type defined in DBO.
+      total_required_type_fields: The number of bits set in
+        required_canonical_mask, precomputed with the type's bitmasks.
 
     Returns:
       A match's score as an integer in [0, 100].
     """
-
-    required_canonical_fields = {
-        StandardizeField(field) for field in canonical_fields
-        if not field.IsOptional()
-    }
-
-    standard_canonical_fields: Set[StandardField] = set()
-    for field in canonical_fields:
-      standard_canonical_fields.add(StandardizeField(field))
-
-    matched_fields = len(
-        concrete_fields.intersection(standard_canonical_fields)
-    )
-    matched_required_fields = len(
-        concrete_fields.intersection(required_canonical_fields)
-    )
-
-    total_required_type_fields = len(required_canonical_fields)
-    total_entity_fields = len(concrete_fields)
-    unmatched_entity_fields = len(
-        concrete_fields.difference(standard_canonical_fields)
-    )
-    unmatched_required_fields = len(
-        required_canonical_fields.difference(concrete_fields)
+    matched_fields = _PopCount(concrete_mask & standard_canonical_mask)
+    matched_required_fields = _PopCount(concrete_mask & required_canonical_mask)
+
+    # |A - B| == |A| - |A & B|, so the unmatched counts follow directly from the
+    # intersections above without another pass over either set.
+    unmatched_entity_fields = total_entity_fields - matched_fields
+    unmatched_required_fields = (
+        total_required_type_fields - matched_required_fields
     )
 
     if total_entity_fields <= 0:
@@ -168,7 +322,9 @@ class OntologyWrapper(object):
     return final_score
 
   def _CreateMatch(self, field_list: List[StandardField],
-                   entity_type: EntityType) -> Match:
+                   entity_type: EntityType,
+                   concrete_mask: int,
+                   total_entity_fields: int) -> Match:
     """Creates an instance of Match class.
 
     calls _CalculateMatchScore() on field_list and the set of fields belonging
@@ -179,23 +335,22 @@ class OntologyWrapper(object):
     Args:
       field_list: A list of EntityTypeField objects for a concrete entity.
       entity_type: An EntityType object.
+      concrete_mask: The bitmask of field_list, built once per query by the
+        caller with _FieldMask().
+      total_entity_fields: The number of distinct fields in field_list.
 
     Returns:
       An instance of Match class.
     """
-    canonical_field_set = set()
-    for qualified_field in entity_type.GetAllFields().values():
-      new_entity_type_field = EntityTypeField(
-          qualified_field.field.namespace,
-          qualified_field.field.field,
-          qualified_field.optional,
-          qualified_field.field.increment
-      )
-      canonical_field_set.add(new_entity_type_field)
+    (standard_canonical_mask, required_canonical_mask,
+     total_required_type_fields) = self._canonical_cache[id(entity_type)]
 
     match_score = self._CalculateMatchScore(
-        concrete_fields=frozenset(field_list),
-        canonical_fields=frozenset(canonical_field_set)
+        concrete_mask=concrete_mask,
+        total_entity_fields=total_entity_fields,
+        standard_canonical_mask=standard_canonical_mask,
+        required_canonical_mask=required_canonical_mask,
+        total_required_type_fields=total_required_type_fields
     )
     new_match = Match(
         field_list,
@@ -207,7 +362,9 @@ class OntologyWrapper(object):
   def GetEntityTypesFromFields(self,
                                field_list: List[StandardField],
                                return_size: int = 0,
-                               general_type: str = None) -> List[Match]:
+                               general_type: str = None,
+                               shared_fields_only: bool = False
+                               ) -> List[Match]:
     """Get a list of Match objects for all entity types defined in DBO.
 
     Args:
@@ -217,32 +374,50 @@ class OntologyWrapper(object):
         be returned.
       general_type: A string indicating a general type name to filter return
         results.
+      shared_fields_only: when true only entity types implementing at least
+        one field in field_list are scored, rather than every type in DBO.
     Returns:
       A sorted list of Match objects.
     """
-    entity_type_list = []
-    type_namespaces_list = self.universe.GetEntityTypeNamespaces()
-    for tns in type_namespaces_list:
-      for entity_type in tns.valid_types_map.values():
-        if entity_type.is_abstract or not entity_type.GetAllFields():
-          continue
-        if general_type is not None:
-          if general_type.upper() in entity_type.unqualified_parent_names:
-            entity_type_list.append(entity_type)
-        else:
-          entity_type_list.append(entity_type)
-
+    if general_type is not None:
+      entity_type_list = self._concrete_types_by_general.get(
+          general_type.upper(), [])
+    else:
+      entity_type_list = self._concrete_types
+    if shared_fields_only:
+      candidate_types = {
+          entity_type for field in field_list
+          for entity_type in self._field_to_types.get(field, ())
+      }
+      if general_type is not None:
+        candidate_types.intersection_update(entity_type_list)
+      # Restore index order so that tied matches keep the same order
+      # regardless of shared_fields_only.
+      entity_type_list = sorted(
+          candidate_types,
+          key=lambda entity_type: self._type_order[id(entity_type)])
+
+    concrete_fields = frozenset(field_list)
+    concrete_mask = self._FieldMask(concrete_fields)
+    total_entity_fields = len(concrete_fields)
     match_list = []
     for entity_type in entity_type_list:
-      match_list.append(self._CreateMatch(field_list, entity_type))
+      match_list.append(
+          self._CreateMatch(field_list, entity_type, concrete_mask,
+                            total_entity_fields))
 
+    if return_size > 0:
+      # Equivalent to sorting and slicing, without sorting the long tail.
+      return heapq.nlargest(
+          return_size,
+          match_list,
+          key=lambda x: x.GetMatchScore()
+      )
     match_list_sorted = sorted(
         match_list,
         key=lambda x: x.GetMatchScore(),
         reverse=True
     )
-    if return_size > 0:
-      return match_list_sorted[:return_size]
     return match_list_sorted
 
   def _PopulateMatrix(self, match: Match):
@@ -259,15 +434,9 @@ class OntologyWrapper(object):
     concrete_field_set = set(match.GetFieldList())
 
     canonical_field_dict = {}
-    for qualified_field in match.GetEntityType().GetAllFields().values():
-      new_entity_type_field = EntityTypeField(
-          qualified_field.field.namespace,
-          qualified_field.field.field,
-          qualified_field.optional,
-          qualified_field.field.increment
-      )
-      new_standard_field = StandardizeField(new_entity_type_field)
-      canonical_field_dict[new_standard_field] = new_entity_type_field
+    for entity_type_field in self._SortedTypeFields(match.GetEntityType())[0]:
+      new_standard_field = StandardizeField(entity_type_field)
+      canonical_field_dict[new_standard_field] = entity_type_field
 
     standard_canonical_field_set = set(canonical_field_dict.keys())
 
@@ -346,8 +515,20 @@ class OntologyWrapper(object):
     if not isinstance(field, StandardField):
       raise TypeError('Field argument must be a StandardField object.\n' +
                       f'You provided a {type(field)} object.')
-    namespace_name = field.GetNamespaceName()
-    standard_field_name = field.GetStandardFieldName()
-    validity = self.universe.field_universe.IsFieldDefined(
-        namespace_name=namespace_name, fieldname=standard_field_name)
-    return validity
+    # Field names may carry an increment, e.g. zone_air_temperature_sensor_1.
+    standard_field_name, _ = entity_type_lib.SeparateFieldIncrement(
+        field.GetStandardFieldName())
+    return (field.GetNamespaceName(),
+            standard_field_name) in self._valid_field_keys
+
+  def AreFieldsValid(
+      self, fields: Iterable[StandardField]) -> Dict[StandardField, bool]:
+    """Validates a collection of field names against the ontology at once.
+
+    Args:
+      fields: StandardField objects to validate.
+
+    Returns:
+      A dictionary mapping each field to whether it is defined in the ontology.
+    """
+    return {field: self.IsFieldValid(field) for field in fields}
@@ -13,9 +13,8 @@
 # limitations under the License.
 
 """Main module for DBO explorer."""
-import ast
 import re
-from typing import List
+from typing import List, Optional
 
 # pylint: disable=g-importing-member
 import colorama
@@ -30,15 +29,34 @@ DEFAULT_MATCHED_TYPES_LIST_SIZE = 10
 DELIMITER_REGEX = r'[\s|\r|\n|,|/|;]+'
 
 
-def _InputFieldsFromUser() -> List[StandardField]:
+def _InputFieldsFromUser(
+    fields_filepath: Optional[str] = None,
+) -> List[StandardField]:
   """Method to take in field inputs from the user.
 
+  Args:
+    fields_filepath: [Optional] path to a file listing the fields. When
+      provided, fields are read from the file rather than prompted for.
+
   Returns:
     A list of StandardField objects corresponding to the input field names.
   """
-  raw_input_string = input('Enter your fields here as a comma separated list: ')
+  if fields_filepath is not None:
+    try:
+      with open(fields_filepath, 'r', encoding='utf-8') as fields_file:
+        raw_input_string = fields_file.read()
+    except OSError as os_error:
+      raise ValueError(
+          f'Unable to read fields file {fields_filepath}: {os_error}'
+      ) from os_error
+  else:
+    raw_input_string = input(
+        'Enter your fields here as a comma separated list: '
+    )
   standard_field_list = []
   for field in re.split(DELIMITER_REGEX, raw_input_string):
+    if not field:
+      continue
     split_field = re.split(FIELD_INCREMENT_REGEX, field)
     standard_field = StandardField(
         standard_field_name=split_field[0],
@@ -46,6 +64,8 @@ def _InputFieldsFromUser() -> List[StandardField]:
         increment=split_field[1],
     )
     standard_field_list.append(standard_field)
+  if not standard_field_list:
+    raise ValueError('No fields were provided.')
   return standard_field_list
 
 
@@ -60,17 +80,28 @@ def _PrintFieldMatchComparison(ontology, entity_type_match_dict) -> None:
     ontology: An instance of the OntologyWrapper class.
     entity_type_match_dict: A dictionary of enumerated Match class instances.
   """
+  if not entity_type_match_dict:
+    return
   visualize = input(
       'Would you like to see field comparisons for these matches? (y/n): '
   )
   if visualize == 'y':
     visualize_done = False
     while not visualize_done:
-      comparison_number = ast.literal_eval(
-          input('which match would you like to visualize?\nmatch number: ')
-      )
-      if not isinstance(comparison_number, int):
+      comparison_input = input(
+          'which match would you like to visualize? (q to stop)\n'
+          'match number: '
+      ).strip()
+      if comparison_input in ('', 'q'):
+        break
+      try:
+        comparison_number = int(comparison_input)
+      except ValueError:
         print(colored('Please enter a valid numerical input', 'red'))
+        continue
+      if comparison_number - 1 not in entity_type_match_dict:
+        print(colored('Please enter a listed match number', 'red'))
+        continue
       print_match = entity_type_match_dict[comparison_number - 1]
       print(ontology.PrintFieldSetComparison(print_match))
       repeat_comparison = input(
@@ -100,20 +131,28 @@ def GetFieldsForTypeName(ontology):
     print(colored(optional_field, 'yellow'))
 
 
-def GetTypesForFieldList(ontology):
+def GetTypesForFieldList(ontology, fields_filepath: Optional[str] = None):
   """Prints a list of entity types matching a list of input fields.
 
   Args:
     ontology: An instance of the OntologyWrapper class.
+    fields_filepath: [Optional] path to a file listing the fields to match.
   """
-  standard_field_list = _InputFieldsFromUser()
+  standard_field_list = _InputFieldsFromUser(fields_filepath)
 
   entity_type_match_dict = {}
   for i, match in enumerate(
-      ontology.GetEntityTypesFromFields(standard_field_list)
+      ontology.GetEntityTypesFromFields(
+          standard_field_list, shared_fields_only=True
+      )
   ):
     entity_type_match_dict[i] = match
-  for i in range(DEFAULT_MATCHED_TYPES_LIST_SIZE):
+  if not entity_type_match_dict:
+    print(colored('No entity types share these fields', 'red'))
+    return
+  for i in range(
+      min(DEFAULT_MATCHED_TYPES_LIST_SIZE, len(entity_type_match_dict))
+  ):
     print(colored(f'{i+1}. {entity_type_match_dict[i]}', 'green'))
   _PrintFieldMatchComparison(ontology, entity_type_match_dict)
   match_selection = input('Would you like to see all matches? (y/n): ')
@@ -137,16 +176,20 @@ def ValidateFieldName(ontology):
   fields = re.split(DELIMITER_REGEX, raw_fields)
   global_namespace_string = 'GLOBAL'
   namespace_list = ['', 'HVAC', 'LIGHTING']
+  standard_fields = {
+      (field_name, namespace): model.StandardField(namespace, field_name)
+      for field_name in fields
+      for namespace in namespace_list
+  }
+  field_validity = ontology.AreFieldsValid(standard_fields.values())
   valid_fields_map = {}
-  for field_name in fields:
-    valid_fields_map[field_name] = []
-    for namespace in namespace_list:
-      standard_field = model.StandardField(namespace, field_name)
-      if ontology.IsFieldValid(standard_field):
-        if not namespace:
-          valid_fields_map.get(field_name).append(global_namespace_string)
-        else:
-          valid_fields_map.get(field_name).append(namespace)
+  for (field_name, namespace), standard_field in standard_fields.items():
+    valid_namespaces = valid_fields_map.setdefault(field_name, [])
+    if field_validity[standard_field]:
+      if not namespace:
+        valid_namespaces.append(global_namespace_string)
+      else:
+        valid_namespaces.append(namespace)
   for field_name in fields:
     valid_namespaces = valid_fields_map.get(field_name)
     if valid_namespaces:
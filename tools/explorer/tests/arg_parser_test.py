@@ -20,13 +20,22 @@ from lib import arg_parser
 
 class ArgParserTest(absltest.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    pass
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls.parser = arg_parser.ParseArgs()
 
   def testParseArgs(self):
-    output_parser = arg_parser.ParseArgs()
-    self.assertEqual(type(output_parser), argparse.ArgumentParser)
+    self.assertEqual(type(self.parser), argparse.ArgumentParser)
+
+  def testParseFieldsFileArg(self):
+    parsed_args = self.parser.parse_args(
+        ['--fields-file', 'path/to/fields.txt'])
+    self.assertEqual(parsed_args.fields_filepath, 'path/to/fields.txt')
+
+  def testFieldsFileArgDefaultsNone(self):
+    parsed_args = self.parser.parse_args([])
+    self.assertIsNone(parsed_args.fields_filepath)
 
 
 if __name__ == '__main__':
@@ -104,6 +104,22 @@ class EntityTypeFieldTest(absltest.TestCase):
 
     self.assertEqual(function_output, expected_output)
 
+  def testStandardizeFieldKeepsIncrement(self):
+    incremented_entity_type_field = EntityTypeField(
+        namespace_name='',
+        standard_field_name='supply_air_flowrate_sensor',
+        is_optional=True,
+        increment='_1')
+    expected_output = StandardField(
+        namespace_name='',
+        standard_field_name='supply_air_flowrate_sensor',
+        increment='_1')
+
+    function_output = StandardizeField(incremented_entity_type_field)
+
+    self.assertEqual(function_output, expected_output)
+    self.assertNotIsInstance(function_output, EntityTypeField)
+
   def testEqualityWithStandardField(self):
     test_standard_field = StandardField(
         namespace_name='', standard_field_name='supply_air_flowrate_sensor')
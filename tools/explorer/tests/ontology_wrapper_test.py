@@ -100,6 +100,45 @@ class OntologyTest(absltest.TestCase):
     for i in range(max(len(expected_output), len(function_output))):
       self.assertEqual(expected_output[i], function_output[i])
 
+  def testGetEntityTypesFromFieldsPartialMatch(self):
+    input_field_list = [
+        StandardField('', 'run_command'),
+        StandardField('', 'power_sensor'),
+        StandardField('', 'zone_use_label')
+    ]
+    etu = self.universe.entity_type_universe
+    expected_output = [
+        Match(input_field_list, etu.GetEntityType('HVAC', 'FAN_SS'), 58),
+        Match(input_field_list, etu.GetEntityType('HVAC', 'FAN_SS_ABC'), 29)
+    ]
+
+    function_output = self.ontology.GetEntityTypesFromFields(
+        input_field_list,
+        return_size=2
+    )
+
+    self.assertEqual(expected_output, function_output)
+
+  def testGetEntityTypesFromFieldsSharedFieldsOnly(self):
+    input_field_list = [
+        StandardField('', 'exhaust_air_damper_command'),
+        StandardField('', 'exhaust_air_damper_status'),
+        StandardField('', 'manufacturer_label'),
+        StandardField('', 'model_label')
+    ]
+    etu = self.universe.entity_type_universe
+    expected_output = [
+        Match(input_field_list, etu.GetEntityType('HVAC', 'DMP_EDM'), 100),
+        Match(input_field_list, etu.GetEntityType('HVAC', 'SDC_EXT'), 25)
+    ]
+
+    function_output = self.ontology.GetEntityTypesFromFields(
+        input_field_list,
+        shared_fields_only=True
+    )
+
+    self.assertEqual(expected_output, function_output)
+
   def testFilterTypesWithGeneralTypeFromFields(self):
     input_general_type = 'CHWS'
     input_field_list = [
@@ -123,15 +162,76 @@ class OntologyTest(absltest.TestCase):
     for i in range(len(expected_output)):
       self.assertEqual(expected_output[i], function_output[i])
 
+  def testSharedFieldsOnlyKeepsTiedMatchOrder(self):
+    input_field_list = [
+        StandardField('', 'run_status'),
+        StandardField('', 'supply_water_temperature_sensor')
+    ]
+    shared_type_names = {'CHWS_WDT', 'CHWS_WDT_GATEWAY', 'CHWS_WDT_WDPC2X',
+                         'FAN_SS', 'FAN_SS_ABC'}
+    expected_output = [
+        match for match in self.ontology.GetEntityTypesFromFields(
+            input_field_list)
+        if match.GetEntityType().typename in shared_type_names
+    ]
+
+    function_output = self.ontology.GetEntityTypesFromFields(
+        input_field_list,
+        shared_fields_only=True
+    )
+
+    self.assertEqual(expected_output, function_output)
+
+  def testFilterTypesWithGeneralTypeSharedFieldsOnly(self):
+    input_field_list = [
+        StandardField('', 'return_water_temperature_sensor'),
+        StandardField('', 'supply_water_temperature_sensor'),
+        StandardField('', 'run_command')
+    ]
+
+    function_output = self.ontology.GetEntityTypesFromFields(
+        input_field_list,
+        general_type='CHWS',
+        shared_fields_only=True
+    )
+
+    self.assertEqual(
+        [match.GetEntityType().typename for match in function_output],
+        ['CHWS_WDT'])
+
   def testValidField(self):
     valid_test_field = StandardField('', 'zone_use_label')
     function_output = self.ontology.IsFieldValid(valid_test_field)
     self.assertTrue(function_output)
 
+  def testValidIncrementedField(self):
+    valid_test_field = StandardField('', 'zone_air_temperature_sensor_1')
+    function_output = self.ontology.IsFieldValid(valid_test_field)
+    self.assertTrue(function_output)
+
   def testInvalidField(self):
     invalid_test_field = StandardField('HVAC', 'exhaust_air_damper_command')
     function_output = self.ontology.IsFieldValid(invalid_test_field)
     self.assertFalse(function_output)
 
+  def testAreFieldsValid(self):
+    valid_test_field = StandardField('', 'zone_use_label')
+    incremented_test_field = StandardField('', 'zone_air_temperature_sensor_1')
+    invalid_test_field = StandardField('HVAC', 'exhaust_air_damper_command')
+
+    function_output = self.ontology.AreFieldsValid(
+        [valid_test_field, incremented_test_field, invalid_test_field])
+
+    self.assertEqual(
+        function_output, {
+            valid_test_field: True,
+            incremented_test_field: True,
+            invalid_test_field: False
+        })
+
+  def testAreFieldsValidRaisesTypeError(self):
+    with self.assertRaises(TypeError):
+      self.ontology.AreFieldsValid(['zone_use_label'])
+
 if __name__ == '__main__':
   absltest.main()
@@ -0,0 +1,109 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the License);
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Testing module for parse_input.py."""
+import os
+import tempfile
+from unittest import mock
+
+from absl.testing import absltest
+from lib import parse_input
+from lib.model import StandardField
+
+# pylint: disable=protected-access
+
+class ParseInputTest(absltest.TestCase):
+
+  def testInputFieldsFromFile(self):
+    with tempfile.TemporaryDirectory() as temp_dir:
+      fields_filepath = os.path.join(temp_dir, 'fields.txt')
+      with open(fields_filepath, 'w', encoding='utf-8') as fields_file:
+        fields_file.write(
+            'run_command, power_sensor\n\nzone_air_temperature_sensor_1\n')
+
+      function_output = parse_input._InputFieldsFromUser(fields_filepath)
+
+    expected_output = [
+        StandardField('', 'run_command'),
+        StandardField('', 'power_sensor'),
+        StandardField('', 'zone_air_temperature_sensor', '_1')
+    ]
+    self.assertEqual(function_output, expected_output)
+
+  def testInputFieldsFromEmptyFileRaisesValueError(self):
+    with tempfile.TemporaryDirectory() as temp_dir:
+      fields_filepath = os.path.join(temp_dir, 'fields.txt')
+      with open(fields_filepath, 'w', encoding='utf-8') as fields_file:
+        fields_file.write(' ,\n')
+
+      with self.assertRaises(ValueError):
+        parse_input._InputFieldsFromUser(fields_filepath)
+
+  def testInputFieldsFromEmptyPromptRaisesValueError(self):
+    with mock.patch('builtins.input', return_value=''):
+      with self.assertRaises(ValueError):
+        parse_input._InputFieldsFromUser()
+
+  def testInputFieldsFromMissingFileRaisesValueError(self):
+    with tempfile.TemporaryDirectory() as temp_dir:
+      missing_filepath = os.path.join(temp_dir, 'missing_fields.txt')
+
+      with self.assertRaises(ValueError):
+        parse_input._InputFieldsFromUser(missing_filepath)
+
+  def testGetTypesForFieldListWithoutMatches(self):
+    ontology = mock.Mock()
+    ontology.GetEntityTypesFromFields.return_value = []
+
+    with mock.patch('builtins.input', side_effect=['bogus_field_name']):
+      parse_input.GetTypesForFieldList(ontology)
+
+    ontology.GetEntityTypesFromFields.assert_called_once_with(
+        [StandardField('', 'bogus_field_name')], shared_fields_only=True)
+    ontology.PrintFieldSetComparison.assert_not_called()
+
+  def testPrintFieldMatchComparisonSkipsEmptyMatches(self):
+    ontology = mock.Mock()
+
+    with mock.patch('builtins.input') as mock_input:
+      parse_input._PrintFieldMatchComparison(ontology, {})
+
+    mock_input.assert_not_called()
+    ontology.PrintFieldSetComparison.assert_not_called()
+
+  def testPrintFieldMatchComparisonRepromptsForInvalidNumbers(self):
+    ontology = mock.Mock()
+    ontology.PrintFieldSetComparison.return_value = 'comparison'
+    first_match, second_match = mock.Mock(), mock.Mock()
+    # Ask for comparisons, then give an invalid, an unlisted and a valid match
+    # number before declining another comparison.
+    user_answers = ['y', 'abc', '3', '2', 'n']
+
+    with mock.patch('builtins.input', side_effect=user_answers):
+      parse_input._PrintFieldMatchComparison(
+          ontology, {0: first_match, 1: second_match})
+
+    ontology.PrintFieldSetComparison.assert_called_once_with(second_match)
+
+  def testPrintFieldMatchComparisonStopsOnQuit(self):
+    ontology = mock.Mock()
+
+    with mock.patch('builtins.input', side_effect=['y', 'abc', 'q']):
+      parse_input._PrintFieldMatchComparison(ontology, {0: mock.Mock()})
+
+    ontology.PrintFieldSetComparison.assert_not_called()
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -20,9 +20,10 @@ import scorer
 
 
 class CliTest(absltest.TestCase):
-  def setUp(self):
-    super().setUp()
-    self.cli = scorer.parse_args()
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls.cli = scorer.parse_args()
 
   def testCliIsParser(self):
     self.assertEqual(type(self.cli), argparse.ArgumentParser)
@@ -51,7 +51,9 @@ def CreateParser() -> argparse.ArgumentParser:
       '-i',
       '--interactive',
       dest='interactive',
-      default='False',
+      default=False,
+      # Parse the flag value into a bool rather than keeping the raw string.
+      type=lambda x: (str(x).lower() in ['true', '1', 'yes']),
       help='interactive mode',
       required=False,
       metavar='interactive mode'
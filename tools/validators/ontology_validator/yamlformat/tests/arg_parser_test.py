@@ -14,7 +14,6 @@
 
 """Testing module for arg_parser.py."""
 import argparse
-import ast
 from absl.testing import absltest
 
 from yamlformat import arg_parser
@@ -22,9 +21,10 @@ from yamlformat import arg_parser
 
 class ArgParserTest(absltest.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    self.parser = arg_parser.CreateParser()
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls.parser = arg_parser.CreateParser()
 
   def testParserIsParser(self):
     self.assertEqual(type(self.parser), argparse.ArgumentParser)
@@ -39,7 +39,7 @@ class ArgParserTest(absltest.TestCase):
     ])
     self.assertEqual(parsed.original, './my/path/to/foo')
     self.assertIsNone(parsed.modified_types_filepath)
-    self.assertFalse(ast.literal_eval(parsed.interactive))
+    self.assertFalse(parsed.interactive)
     self.assertTrue(parsed.allow_missing_type_guids)
 
   def testOriginalArgIsRequired(self):
@@ -55,7 +55,7 @@ class ArgParserTest(absltest.TestCase):
     ])
     self.assertEqual(parsed.original, './my/path/to/foo')
     self.assertIsNone(parsed.modified_types_filepath)
-    self.assertTrue(ast.literal_eval(parsed.interactive))
+    self.assertTrue(parsed.interactive)
 
   def testNoInteractiveFlag(self):
     parsed = self.parser.parse_args([
@@ -64,7 +64,7 @@ class ArgParserTest(absltest.TestCase):
     ])
     self.assertEqual(parsed.original, './my/path/to/foo')
     self.assertIsNone(parsed.modified_types_filepath)
-    self.assertFalse(ast.literal_eval(parsed.interactive))
+    self.assertFalse(parsed.interactive)
 
   def testNoAllowMissingTypeGuidsFlag(self):
     parsed = self.parser.parse_args([
@@ -75,7 +75,7 @@ class ArgParserTest(absltest.TestCase):
     ])
     self.assertEqual(parsed.original, './my/path/to/foo')
     self.assertIsNone(parsed.modified_types_filepath)
-    self.assertTrue(ast.literal_eval(parsed.interactive))
+    self.assertTrue(parsed.interactive)
     self.assertFalse(parsed.allow_missing_type_guids)
 
 if __name__ == '__main__':
@@ -19,7 +19,6 @@ from __future__ import division
 from __future__ import print_function
 
 import argparse
-import ast
 from os import path
 import sys
 
@@ -46,7 +45,7 @@ def main(parsed_args: argparse.ArgumentParser):
       filter_text,
       path.expanduser(parsed_args.original),
       modified_types_filepath,
-      interactive=ast.literal_eval(parsed_args.interactive),
+      interactive=parsed_args.interactive,
       require_type_guids=not parsed_args.allow_missing_type_guids)
 
 if __name__ == '__main__':